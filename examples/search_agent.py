@@ -28,7 +28,7 @@ async def llm_policy(
         List of Messages containing text and/or option_call payloads.
     """
     adapter = CompletionsAdapter(observations, options)
-    client = CompletionsAdapter.client()
+    client = AppContext.get_ctx().llm_client
     response = await client.chat.completions.create(
         model="gpt-5-nano",
         messages=adapter.messages,  # type: ignore[arg-type]
@@ -85,6 +85,8 @@ class AppContext(BaseContext):
 
     def __init__(self, runner):
         super().__init__(runner)
+        # One client (and connection pool) shared by every LLM call in this app
+        self.llm_client = CompletionsAdapter.client()
         self.llm = self._bind(llm_policy)
         self.web_search = self._bind(web_seatch_ddgs_policy)
         self.search_agent = self._bind(search_agent)
@@ -97,7 +99,10 @@ async def main():
 
     runner = InMemoryRunner()
     ctx = AppContext(runner)
-    result = await ctx.search_agent(prompt="What is the latest Python version?")
+    try:
+        result = await ctx.search_agent(prompt="What is the latest Python version?")
+    finally:
+        await ctx.llm_client.close()
 
     # Get final text message
     final_msg = next((msg for msg in reversed(result) if msg.parts), '')
@@ -217,3 +217,14 @@ class TestCompletionsAdapterClient:
 
             mock_class.assert_called_once_with(api_key="test")
             assert result == mock_client
+
+    def test_client_is_not_shared_between_calls(self):
+        """Test that each client() call builds its own client (no global cache)."""
+        with patch('examples.utils.completions_adapter.AsyncOpenAI') as mock_class:
+            mock_class.side_effect = lambda **kwargs: Mock()
+
+            first = CompletionsAdapter.client(api_key="a")
+            second = CompletionsAdapter.client(api_key="a")
+
+            assert first is not second
+            assert mock_class.call_count == 2
@@ -0,0 +1,94 @@
+"""Unit tests for the YouTube transcription policies."""
+
+import asyncio
+import sys
+
+import pytest
+from unittest.mock import patch
+
+import examples.utils.transcribe_youtube_policy  # noqa: F401
+from examples.utils.transcribe_youtube_policy import (
+    TranscriptResult,
+    transcribe_youtube_batch_policy,
+)
+
+# The package re-exports the policy under the module's name, so look the module up directly
+transcribe_module = sys.modules["examples.utils.transcribe_youtube_policy"]
+
+
+def _fake_result(url: str) -> TranscriptResult:
+    video_id = transcribe_module._extract_video_id(url)
+    if not video_id:
+        return TranscriptResult(
+            title="", transcript="", thumbnail_url="", video_id="", error="Invalid YouTube URL"
+        )
+    return TranscriptResult(
+        title=f"title {video_id}", transcript="", thumbnail_url="", video_id=video_id
+    )
+
+
+class TestTranscribeYoutubeBatchPolicy:
+    """Test batch transcription dedupe, ordering and concurrency."""
+
+    @pytest.mark.asyncio
+    async def test_duplicate_urls_fetch_video_once(self):
+        """Test that URLs for the same video are transcribed once and fanned back out."""
+        fetched = []
+
+        async def fake_transcribe(url):
+            fetched.append(url)
+            return _fake_result(url)
+
+        urls = [
+            "https://www.youtube.com/watch?v=aaaaaaaaaaa",
+            "https://youtu.be/aaaaaaaaaaa",
+            "https://www.youtube.com/watch?v=bbbbbbbbbbb",
+        ]
+        with patch.object(transcribe_module, "_transcribe", side_effect=fake_transcribe):
+            results = await transcribe_youtube_batch_policy(urls)
+
+        assert fetched == [urls[0], urls[2]]
+        assert [r.video_id for r in results] == ["aaaaaaaaaaa", "aaaaaaaaaaa", "bbbbbbbbbbb"]
+
+    @pytest.mark.asyncio
+    async def test_invalid_url_keeps_its_position(self):
+        """Test that an invalid URL gets its own error result in input order."""
+        async def fake_transcribe(url):
+            # Finish in reverse order to check results are not in completion order
+            await asyncio.sleep(0.01 if "aaaa" in url else 0)
+            return _fake_result(url)
+
+        urls = [
+            "https://www.youtube.com/watch?v=aaaaaaaaaaa",
+            "not a url",
+            "https://www.youtube.com/watch?v=bbbbbbbbbbb",
+            "not a url",
+        ]
+        with patch.object(transcribe_module, "_transcribe", side_effect=fake_transcribe):
+            results = await transcribe_youtube_batch_policy(urls)
+
+        assert [r.video_id for r in results] == ["aaaaaaaaaaa", "", "bbbbbbbbbbb", ""]
+        assert results[1].error == "Invalid YouTube URL"
+        assert results[3] is results[1]
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_limited(self):
+        """Test that no more than _MAX_CONCURRENT_VIDEOS fetches run at once."""
+        in_flight = 0
+        peak = 0
+
+        async def fake_transcribe(url):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return _fake_result(url)
+
+        urls = [f"https://www.youtube.com/watch?v={i:011d}" for i in range(6)]
+        with patch.object(transcribe_module, "_transcribe", side_effect=fake_transcribe), \
+                patch.object(transcribe_module, "_MAX_CONCURRENT_VIDEOS", 2):
+            results = await transcribe_youtube_batch_policy(urls)
+
+        assert peak == 2
+        assert [r.video_id for r in results] == [f"{i:011d}" for i in range(6)]
@@ -11,6 +11,7 @@ from .search_web_policies import (
 
 from .transcribe_youtube_policy import (
     transcribe_youtube_policy,
+    transcribe_youtube_batch_policy,
 )
 
 __all__ = [
@@ -18,4 +19,5 @@ __all__ = [
     "CompletionsAdapter",
     "web_seatch_ddgs_policy",
     "transcribe_youtube_policy",
+    "transcribe_youtube_batch_policy",
 ]
@@ -87,6 +87,10 @@ class CompletionsAdapter:
     def client(**kwargs) -> AsyncOpenAI:
         """Create an AsyncOpenAI client.
         
+        Each call returns a new client with its own connection pool. Create
+        one per app (e.g. on your context) and reuse it across requests,
+        rather than one per call.
+        
         Args:
             **kwargs: Passed to AsyncOpenAI constructor
                 - api_key: API key (defaults to OPENAI_API_KEY env var)
@@ -116,31 +120,32 @@ class CompletionsAdapter:
     
     def _encode_messages(self, in_msgs: list[Message]) -> list[dict[str, Any]]:
         """Convert pocket-joe Messages to chat completions format."""
-        # Build mapping of invocation_id -> option_result
-        tool_results: dict[str, Message] = {}
-        for msg in in_msgs:
-            if msg.payload and isinstance(msg.payload, OptionResultPayload):
-                tool_results[msg.payload.invocation_id] = msg
+        # Build mapping of invocation_id -> option_result payload
+        tool_results: dict[str, OptionResultPayload] = {
+            msg.payload.invocation_id: msg.payload
+            for msg in in_msgs
+            if isinstance(msg.payload, OptionResultPayload)
+        }
 
         messages: list[dict[str, Any]] = []
+        append = messages.append
         for msg in in_msgs:
             # Handle parts messages (text + media)
             if msg.parts:
-                text_parts = [p for p in msg.parts if isinstance(p, TextPart)]
-                content = " ".join(p.text for p in text_parts)
-                role = msg.role_hint_for_llm or "assistant"
-                messages.append({"role": role, "content": content})
+                content = " ".join(p.text for p in msg.parts if isinstance(p, TextPart))
+                append({"role": msg.role_hint_for_llm or "assistant", "content": content})
 
             # Handle option_call messages
-            elif msg.payload and isinstance(msg.payload, OptionCallPayload):
+            elif isinstance(msg.payload, OptionCallPayload):
                 call_payload = msg.payload
                 invocation_id = call_payload.invocation_id
 
                 # Only include if we have the corresponding result (complete pair)
-                if invocation_id not in tool_results:
+                result_payload = tool_results.get(invocation_id)
+                if result_payload is None:
                     continue
 
-                messages.append({
+                append({
                     "role": "assistant",
                     "tool_calls": [{
                         "type": "function",
@@ -152,20 +157,12 @@ class CompletionsAdapter:
                     }],
                 })
 
-                result_msg = tool_results[invocation_id]
-                result_payload = result_msg.payload
-                if isinstance(result_payload, OptionResultPayload):
-                    result = result_payload.result
-                    if isinstance(result, str):
-                        content = result
-                    else:
-                        content = json.dumps(result)
-
-                    messages.append({
-                        "role": "tool",
-                        "tool_call_id": invocation_id,
-                        "content": content
-                    })
+                result = result_payload.result
+                append({
+                    "role": "tool",
+                    "tool_call_id": invocation_id,
+                    "content": result if isinstance(result, str) else json.dumps(result)
+                })
 
         return messages
     
@@ -1,5 +1,6 @@
 """YouTube video transcription policy."""
 
+import asyncio
 import re
 import requests
 from bs4 import BeautifulSoup
@@ -8,6 +9,11 @@ from pydantic import BaseModel
 
 from pocket_joe import policy
 
+_VIDEO_ID_PATTERN = re.compile(r'(?:v=|\/)([0-9A-Za-z_-]{11})')
+
+# Cap on concurrent video fetches in batch mode, to stay under YouTube rate limits
+_MAX_CONCURRENT_VIDEOS = 8
+
 
 class TranscriptResult(BaseModel):
     """Result of YouTube video transcription."""
@@ -18,27 +24,29 @@ class TranscriptResult(BaseModel):
     error: str | None = None
 
 
+def _fetch_title(url: str) -> str:
+    """Fetch the video page and extract its title."""
+    response = requests.get(url)
+    soup = BeautifulSoup(response.text, 'html.parser')
+    title_tag = soup.find('title')
+    return title_tag.text.replace(" - YouTube", "") if title_tag else "Unknown Title"
+
+
+def _fetch_transcript(video_id: str) -> str:
+    """Fetch the transcript and join its snippets into one string."""
+    ytt_api = YouTubeTranscriptApi()
+    fetched_transcript = ytt_api.fetch(video_id)
+    return " ".join([snippet.text for snippet in fetched_transcript])
+
+
 def _extract_video_id(url: str) -> str | None:
     """Extract YouTube video ID from URL."""
-    pattern = r'(?:v=|\/)([0-9A-Za-z_-]{11})'
-    match = re.search(pattern, url)
+    match = _VIDEO_ID_PATTERN.search(url)
     return match.group(1) if match else None
 
 
-@policy.tool(description="Transcribe YouTube video and retrieve transcript and metadata")
-async def transcribe_youtube_policy(
-    url: str,
-) -> TranscriptResult:
-    """
-    Get video title, transcript and thumbnail from YouTube URL.
-
-    Args:
-        url: YouTube video URL
-
-    Returns:
-        TranscriptResult with title, transcript, thumbnail_url, video_id
-        or error field populated on failure
-    """
+async def _transcribe(url: str) -> TranscriptResult:
+    """Fetch title, transcript and thumbnail for a single YouTube URL."""
     video_id = _extract_video_id(url)
     if not video_id:
         return TranscriptResult(
@@ -50,19 +58,16 @@ async def transcribe_youtube_policy(
         )
 
     try:
-        # Get title using BeautifulSoup
-        response = requests.get(url)
-        soup = BeautifulSoup(response.text, 'html.parser')
-        title_tag = soup.find('title')
-        title = title_tag.text.replace(" - YouTube", "") if title_tag else "Unknown Title"
+        # Page title and transcript come from independent endpoints; fetch both concurrently
+        fetches = asyncio.gather(
+            asyncio.to_thread(_fetch_title, url),
+            asyncio.to_thread(_fetch_transcript, video_id),
+        )
 
         # Get thumbnail
         thumbnail_url = f"https://img.youtube.com/vi/{video_id}/maxresdefault.jpg"
 
-        # Get transcript
-        ytt_api = YouTubeTranscriptApi()
-        fetched_transcript = ytt_api.fetch(video_id)
-        transcript = " ".join([snippet.text for snippet in fetched_transcript])
+        title, transcript = await fetches
 
         return TranscriptResult(
             title=title,
@@ -78,3 +83,51 @@ async def transcribe_youtube_policy(
             video_id=video_id or "",
             error=str(e)
         )
+
+
+@policy.tool(description="Transcribe YouTube video and retrieve transcript and metadata")
+async def transcribe_youtube_policy(
+    url: str,
+) -> TranscriptResult:
+    """
+    Get video title, transcript and thumbnail from YouTube URL.
+
+    Args:
+        url: YouTube video URL
+
+    Returns:
+        TranscriptResult with title, transcript, thumbnail_url, video_id
+        or error field populated on failure
+    """
+    return await _transcribe(url)
+
+
+@policy.tool(description="Transcribe multiple YouTube videos concurrently")
+async def transcribe_youtube_batch_policy(
+    urls: list[str],
+) -> list[TranscriptResult]:
+    """
+    Get title, transcript and thumbnail for several YouTube URLs at once.
+
+    Each video is fetched once even if it appears under several URLs.
+
+    Args:
+        urls: YouTube video URLs
+
+    Returns:
+        One TranscriptResult per input URL, in input order
+    """
+    # Dedupe by video ID, keeping the first URL seen for each video
+    url_by_key: dict[str, str] = {}
+    for url in urls:
+        url_by_key.setdefault(_extract_video_id(url) or url, url)
+
+    semaphore = asyncio.Semaphore(_MAX_CONCURRENT_VIDEOS)
+
+    async def transcribe_limited(url: str) -> TranscriptResult:
+        async with semaphore:
+            return await _transcribe(url)
+
+    results = await asyncio.gather(*(transcribe_limited(url) for url in url_by_key.values()))
+    result_by_key = dict(zip(url_by_key, results))
+    return [result_by_key[_extract_video_id(url) or url] for url in urls]
@@ -1,6 +1,6 @@
 from typing import Any, Callable, Awaitable, Protocol, TYPE_CHECKING, ClassVar, TypeVar
 from collections.abc import Iterable
-from contextvars import ContextVar
+from contextvars import ContextVar, Token
 from pydantic import BaseModel, ConfigDict
 
 # Import new message types
@@ -19,6 +19,11 @@ from .message import (
 T = TypeVar('T', bound='BaseContext')
 F = TypeVar('F', bound=Callable[..., Awaitable[list['Message']]])
 
+# Tokens of the open activations, newest last. Held in a ContextVar rather than
+# on the context instance, so each task (which runs in its own context copy)
+# unwinds only its own activations, strictly in LIFO order.
+_active_tokens: ContextVar[tuple[Token, ...]] = ContextVar('pocket_joe_active_tokens', default=())
+
 
 class OptionSchema(BaseModel):
     """Schema for a tool that can be called.
@@ -33,27 +38,31 @@ class OptionSchema(BaseModel):
     parameters: dict[str, Any]
     
     def __hash__(self) -> int:
-        """Hash based on JSON serialization of the model"""
-        return hash(self.model_dump_json())
+        """Hash on the identifying fields.
+
+        Equal schemas always share name and description, so this stays
+        consistent with __eq__ (which compares all fields) without
+        serializing parameters on every hash.
+        """
+        return hash((self.name, self.description))
     
     @classmethod
     def from_func(cls, functions: list[Callable]) -> list['OptionSchema']:
         """Extract schema from bound function"""
-        options = []
-        for func in functions:
-            policy_func = getattr(func, '__policy_func__', func)
-            option_schema = getattr(policy_func, '_option_schema', None)
-            if not option_schema:
-                raise ValueError(f"Function missing @policy.tool _option_schema metadata")
-            options.append(option_schema)
-        return options
+        return [cls.from_func_single(func) for func in functions]
     
     @classmethod
     def from_func_single(cls, function: Callable) -> 'OptionSchema':
-        options = cls.from_func([function])
-        if len(options) != 1:
-            raise ValueError(f"Expected single option, got {len(options)}")
-        return options[0]
+        """Extract schema from a single policy or bound function.
+
+        The schema is computed once by the @policy decorator and stored on the
+        function, so this is an attribute lookup rather than signature parsing.
+        """
+        policy_func = getattr(function, '__policy_func__', function)
+        option_schema = getattr(policy_func, '_option_schema', None)
+        if not option_schema:
+            raise ValueError(f"Function missing @policy.tool _option_schema metadata")
+        return option_schema
 
 class BaseContext:
     """Framework base - hide plumbing here.
@@ -73,9 +82,42 @@ class BaseContext:
             self.__class__._ctx_var = ContextVar(f'{self.__class__.__module__}.{self.__class__.__name__}_context')
 
         self._runner = runner
-        # Set context once during initialization
-        self._ctx_var.set(self)  # type: ignore[union-attr]
-        self._option_to_bound_policy: dict[str, Callable] = {}
+        # The context is only set while it is active (see activate()), so
+        # constructing one does not leak into the caller's contextvars
+        self._option_to_policy: dict[str, Callable] = {}
+
+    def activate(self) -> Token['BaseContext']:
+        """Make this the current context until deactivate(token) is called.
+
+        Bound policies activate their context for the duration of each call,
+        so this is only needed to use get_ctx() outside a policy call.
+        Prefer `with ctx:`, which pairs the calls for you.
+
+        Returns:
+            The token to pass to deactivate()
+        """
+        token = self._ctx_var.set(self)  # type: ignore[union-attr]
+        _active_tokens.set(_active_tokens.get() + (token,))
+        return token
+
+    def deactivate(self, token: Token['BaseContext']) -> None:
+        """Restore the context that was current before activate() returned token.
+
+        Raises:
+            RuntimeError: If token is not from the most recent open activate()
+        """
+        tokens = _active_tokens.get()
+        if not tokens or tokens[-1] is not token:
+            raise RuntimeError("Contexts must be deactivated in reverse order of activation")
+        _active_tokens.set(tokens[:-1])
+        self._ctx_var.reset(token)  # type: ignore[union-attr]
+
+    def __enter__(self: T) -> T:
+        self.activate()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.deactivate(_active_tokens.get()[-1])
 
     @classmethod
     def get_ctx(cls: type[T]) -> T:
@@ -83,10 +125,16 @@ class BaseContext:
 
         Returns the context instance of the actual subclass type.
         For example, AppContext.get_ctx() returns AppContext instance.
+
+        Raises:
+            RuntimeError: If no context of this type is active
         """
         if cls._ctx_var is None:
             raise RuntimeError(f"{cls.__name__} context not initialized")
-        return cls._ctx_var.get()  # type: ignore[return-value]
+        ctx = cls._ctx_var.get(None)
+        if ctx is None:
+            raise RuntimeError(f"No active {cls.__name__}; call it from a bound policy or activate() it first")
+        return ctx  # type: ignore[return-value]
 
     def _bind[F](self, policy: F) -> F:
         """Bind a policy function to this context using runner's strategy.
@@ -100,14 +148,15 @@ class BaseContext:
         Raises:
             ValueError: If a policy with the same name is already bound
         """
-        bound = self._runner._bind_strategy(policy, self)
-        # Store reference to original policy function on the bound function
-        bound.__policy_func__ = policy  # type: ignore
         option_schema = OptionSchema.from_func_single(policy) # type: ignore
         # check for duplicates
-        if option_schema.name in self._option_to_bound_policy:
+        if option_schema.name in self._option_to_policy:
             raise ValueError(f"Duplicate policy name '{option_schema.name}' detected during binding.")
-        self._option_to_bound_policy[option_schema.name] = bound
+        bound = self._runner._bind_strategy(policy, self)
+        # Store reference to original policy function on the bound function
+        bound.__policy_func__ = policy  # type: ignore
+        # Resolve the option name to its policy function once, at bind time
+        self._option_to_policy[option_schema.name] = policy  # type: ignore[assignment]
         return bound  # type: ignore
 
     def get_policy(self, policy_name: str) -> Callable:
@@ -122,11 +171,7 @@ class BaseContext:
         Raises:
             ValueError: If the policy function is not found.
         """
-        bound_policy = self._option_to_bound_policy.get(policy_name)
-        if not bound_policy:
+        policy_func = self._option_to_policy.get(policy_name)
+        if policy_func is None:
             raise ValueError(f"Bound policy not found for option '{policy_name}'")
-        # Get the policy function stored on the bound function
-        policy_func = getattr(bound_policy, '__policy_func__', None)
-        if not policy_func:
-            raise ValueError(f"Policy function not found for bound policy '{policy_name}', check binding.")   
         return policy_func
\ No newline at end of file
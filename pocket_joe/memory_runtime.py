@@ -1,6 +1,7 @@
 from collections.abc import Callable
 
 from .core import BaseContext
+from .policy_wrappers import invoke_options_wrapper_for_func
 
 class InMemoryRunner:
     def _bind_strategy(self, policy: Callable, ctx: BaseContext):
@@ -13,12 +14,18 @@ class InMemoryRunner:
         Returns:
             Async function that wraps the policy with options execution
         """
-        from .policy_wrappers import invoke_options_wrapper_for_func
+        # The wrapper depends only on (policy, ctx), so compose it once per bind
+        wrapped = invoke_options_wrapper_for_func(policy, ctx)
         
         async def bound(**kwargs):
-            wrapped = invoke_options_wrapper_for_func(policy, ctx)
-            selected_actions = await wrapped(**kwargs)
-            return selected_actions
+            # Scope the active context to this call so get_ctx() works inside
+            # the policy without leaking into the caller's context
+            token = ctx.activate()
+            try:
+                selected_actions = await wrapped(**kwargs)
+                return selected_actions
+            finally:
+                ctx.deactivate(token)
 
         return bound
 
@@ -8,9 +8,38 @@ This module defines the core message types used throughout the framework:
 """
 
 import base64
+import itertools
+import os
 from typing import Any, Literal, Optional
 from pydantic import BaseModel, ConfigDict, HttpUrl, model_validator
-import uuid
+
+
+# ============================================================================
+# ID Generation
+# ============================================================================
+
+def _reset_id_source() -> None:
+    """Start a fresh random ID prefix and counter for this process."""
+    global _id_prefix, _id_counter
+    _id_prefix = os.urandom(8).hex()
+    _id_counter = itertools.count()
+
+
+_reset_id_source()
+# A forked child must not reuse its parent's prefix and counter
+# (fork hooks only exist on Unix)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_id_source)
+
+
+def _new_id() -> str:
+    """Return a unique message/invocation ID.
+
+    A random 64-bit per-process prefix keeps IDs unique across processes
+    (e.g. in durable storage); the counter makes each new ID a cheap
+    increment instead of a uuid4() urandom syscall.
+    """
+    return f"{_id_prefix}-{next(_id_counter)}"
 
 
 # ============================================================================
@@ -225,6 +254,9 @@ class MessageBuilder:
     for step_num, policy, and role hints.
     """
 
+    # Builders are created per message; slots avoid a per-instance __dict__
+    __slots__ = ("policy", "step_num", "role_hint_for_llm", "_parts", "_last_option_call")
+
     def __init__(
         self,
         policy: str,
@@ -410,10 +442,10 @@ class MessageBuilder:
             arguments: Arguments for the option
             invocation_id: Optional invocation ID (auto-generated if not provided)
         """
-        inv_id = invocation_id or str(uuid.uuid4())
+        inv_id = invocation_id or _new_id()
 
         option_call_msg = Message(
-            id=str(uuid.uuid4()),
+            id=_new_id(),
             policy=self.policy,
             step_num=self.step_num,
             role_hint_for_llm=self.role_hint_for_llm,
@@ -438,7 +470,7 @@ class MessageBuilder:
             raise ValueError("Cannot build message with no parts. Use add_text() or add_*() methods first.")
 
         return Message(
-            id=str(uuid.uuid4()),
+            id=_new_id(),
             policy=self.policy,
             step_num=self.step_num,
             role_hint_for_llm=self.role_hint_for_llm,
@@ -472,6 +504,8 @@ class OptionResultBuilder:
     option_call message to ensure consistency.
     """
 
+    __slots__ = ("_option_call", "_call_payload", "_policy")
+
     def __init__(self, option_call: Message, policy: Optional[str] = None):
         """Create a builder for an option_result message.
 
@@ -506,7 +540,7 @@ class OptionResultBuilder:
             result: The result value from executing the option
         """
         return Message(
-            id=str(uuid.uuid4()),
+            id=_new_id(),
             policy=self._policy,
             step_num=self._option_call.step_num,
             role_hint_for_llm="tool",
@@ -532,7 +566,7 @@ class OptionResultBuilder:
             retryable: Whether the error is retryable
         """
         return Message(
-            id=str(uuid.uuid4()),
+            id=_new_id(),
             policy=self._policy,
             step_num=self._option_call.step_num,
             role_hint_for_llm="tool",
@@ -4,6 +4,15 @@ from collections.abc import Callable
 from .core import Message, BaseContext, OptionCallPayload, OptionResultPayload, OptionResultBuilder
 
 
+def _is_instance(obj: object, cls: type) -> bool:
+    """isinstance() with an exact-type fast path.
+
+    pydantic's metaclass implements isinstance() in Python, so comparing the
+    exact type first is much cheaper; subclasses still match via the fallback.
+    """
+    return type(obj) is cls or isinstance(obj, cls)
+
+
 async def _call_options_in_parallel(ctx: BaseContext, messages: list[Message]) -> list[Message]:
     """Execute option_call messages in parallel and return their results.
 
@@ -15,26 +24,23 @@ async def _call_options_in_parallel(ctx: BaseContext, messages: list[Message]) -
         List of option_result messages from executing the option_calls
     """
 
-    async def execute_option(option: Message) -> list[Message]:
+    async def execute_option(call_payload: OptionCallPayload, func: Callable) -> Message:
         """Execute a single option_call and wrap result in OptionResultPayload."""
-        if not isinstance(option.payload, OptionCallPayload):
-            raise TypeError(f"Expected OptionCallPayload, got {type(option.payload)}")
-
-        call_payload = option.payload
         policy_name = call_payload.option_name
         args = call_payload.arguments
 
-        if not isinstance(args, dict):
+        # Pydantic already validates arguments on construction; only re-check
+        # in debug runs, for payloads built with model_construct
+        if __debug__ and not isinstance(args, dict):
             raise TypeError(
                 f"Policy '{policy_name}' arguments must be a dict[str, Any], "
                 f"got {type(args).__name__}: {args}"
             )
 
-        func = ctx.get_policy(policy_name)
         result = await func(**args)
 
         # Wrap result in OptionResultPayload
-        wrapped = Message(
+        return Message(
             policy=policy_name,
             payload=OptionResultPayload(
                 invocation_id=call_payload.invocation_id,
@@ -42,34 +48,51 @@ async def _call_options_in_parallel(ctx: BaseContext, messages: list[Message]) -
                 result=result
             )
         )
-        return [wrapped]
 
-    # Find all uncompleted option_call messages
-    completed_ids = {
-        msg.payload.invocation_id for msg in messages
-        if msg.payload and isinstance(msg.payload, OptionResultPayload)
-    }
-
-    options = [
-        msg for msg in messages
-        if msg.payload and isinstance(msg.payload, OptionCallPayload)
-        and msg.payload.invocation_id not in completed_ids
-    ]
+    # Find all uncompleted option_call messages in a single pass
+    completed_ids: set[str] = set()
+    calls: list[OptionCallPayload] = []
+    for msg in messages:
+        payload = msg.payload
+        if payload is None:
+            # Content-only message (the common case), no payload to check
+            continue
+        if _is_instance(payload, OptionCallPayload):
+            calls.append(payload)  # type: ignore[arg-type]
+        elif _is_instance(payload, OptionResultPayload):
+            completed_ids.add(payload.invocation_id)  # type: ignore[union-attr]
+
+    # First turns have no results yet, so there is nothing to filter out
+    if completed_ids:
+        options = [call for call in calls if call.invocation_id not in completed_ids]
+    else:
+        options = calls
 
     if not options:
         return []
 
-    # Execute all substeps in parallel and wait for completion
-    # Exceptions will propagate up the stack
-    option_selected_actions = await asyncio.gather(
-        *[execute_option(option) for option in options]
-    )
+    # Resolve every policy before starting any, so an unknown option fails
+    # fast instead of leaving its siblings running
+    funcs = [ctx.get_policy(call.option_name) for call in options]
 
-    # Flatten results
-    all_option_selected_actions = []
-    for result in option_selected_actions:
-        all_option_selected_actions.extend(result)
-    return all_option_selected_actions
+    # A single option (the common case) needs no task or gather scaffolding
+    if len(options) == 1:
+        return [await execute_option(options[0], funcs[0])]
+
+    # Execute all substeps in parallel and wait for completion
+    # Each substep task runs in its own copy of the current context (an O(1)
+    # copy), so a substep's context var writes never leak into its siblings
+    tasks = [asyncio.create_task(coro) for coro in map(execute_option, options, funcs)]
+    try:
+        # One result message per option, so gather's list needs no flattening
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        # The first exception propagates up the stack; cancel the siblings
+        # (gather alone leaves them running) and let them unwind first
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
 
 def invoke_options_wrapper_for_func(func: Callable, ctx: BaseContext):
     """Returns a wrapped callable that executes options in parallel for function-based policies.
@@ -85,7 +108,11 @@ def invoke_options_wrapper_for_func(func: Callable, ctx: BaseContext):
         selected_actions = await func(**kwargs)
 
         # Only process options if result is list[Message]
-        if isinstance(selected_actions, list) and selected_actions and isinstance(selected_actions[0], Message):
+        if (
+            isinstance(selected_actions, list)
+            and selected_actions
+            and _is_instance(selected_actions[0], Message)
+        ):
             option_results = await _call_options_in_parallel(ctx, selected_actions)
             return selected_actions + option_results
 
@@ -1,7 +1,7 @@
 """Tests for pocket_joe.core module."""
 
 import pytest
-from pocket_joe.core import Message, BaseContext
+from pocket_joe.core import Message, BaseContext, OptionSchema
 from pocket_joe import MessageBuilder, OptionCallPayload, OptionResultPayload, TextPart
 
 
@@ -77,6 +77,28 @@ class TestMessage:
             Message(policy="test")
 
 
+class TestOptionSchema:
+    """Test OptionSchema hashing and equality."""
+
+    def test_equal_schemas_hash_equal(self):
+        """Test equal schemas hash the same and dedupe in sets."""
+        params = {"type": "object", "properties": {"q": {"type": "string"}}}
+        a = OptionSchema(name="search", description="Search", parameters=params)
+        b = OptionSchema(name="search", description="Search", parameters=dict(params))
+
+        assert a == b
+        assert hash(a) == hash(b)
+        assert len({a, b}) == 1
+
+    def test_different_parameters_not_equal(self):
+        """Test schemas differing only in parameters stay distinct."""
+        a = OptionSchema(name="search", description="Search", parameters={})
+        b = OptionSchema(name="search", description="Search", parameters={"type": "object"})
+
+        assert a != b
+        assert len({a, b}) == 2
+
+
 class TestBaseContext:
     """Test BaseContext class."""
     
@@ -230,3 +252,301 @@ class TestBaseContext:
         # Second bind with same name should fail
         with pytest.raises(ValueError, match="Duplicate policy name"):
             ctx._bind(another_policy)
+
+    @pytest.mark.asyncio
+    async def test_bind_executes_option_calls(self):
+        """Test that option_calls returned by a policy are executed and appended."""
+        from pocket_joe import policy, InMemoryRunner
+
+        @policy.tool(description="Get greeting")
+        async def greet(name: str) -> str:
+            return f"Hello, {name}!"
+
+        @policy.tool(description="Orchestrator")
+        async def orchestrator() -> list[Message]:
+            builder = MessageBuilder(policy="orchestrator")
+            builder.add_text("calling tools")
+            builder.add_option_call("greet", {"name": "Bob"}, invocation_id="inv_1")
+            second = MessageBuilder(policy="orchestrator")
+            second.add_option_call("greet", {"name": "Ann"}, invocation_id="inv_2")
+            return builder.to_messages() + second.to_messages()
+
+        runner = InMemoryRunner()
+        ctx = BaseContext(runner)
+        ctx._bind(greet)
+        bound = ctx._bind(orchestrator)
+
+        result = await bound()
+
+        assert len(result) == 5
+        results = [m.payload for m in result[3:]]
+        assert all(isinstance(p, OptionResultPayload) for p in results)
+        assert [(p.invocation_id, p.result) for p in results] == [  # type: ignore[union-attr]
+            ("inv_1", "Hello, Bob!"),
+            ("inv_2", "Hello, Ann!"),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_completed_option_calls_not_reexecuted(self):
+        """Test that option_calls with an existing option_result are skipped."""
+        from pocket_joe import policy, InMemoryRunner, OptionResultBuilder
+
+        calls = []
+
+        @policy.tool(description="Counted tool")
+        async def counted(value: int) -> int:
+            calls.append(value)
+            return value
+
+        @policy.tool(description="Orchestrator")
+        async def orchestrator() -> list[Message]:
+            done = MessageBuilder(policy="orchestrator")
+            done.add_option_call("counted", {"value": 1}, invocation_id="done")
+            done_call = done.last_option_call
+            assert done_call is not None
+            pending = MessageBuilder(policy="orchestrator")
+            pending.add_option_call("counted", {"value": 2}, invocation_id="pending")
+            return [
+                done_call,
+                OptionResultBuilder(done_call).success(1),
+                *pending.to_messages(),
+            ]
+
+        runner = InMemoryRunner()
+        ctx = BaseContext(runner)
+        ctx._bind(counted)
+        bound = ctx._bind(orchestrator)
+
+        result = await bound()
+
+        assert calls == [2]
+        assert len(result) == 4
+        assert isinstance(result[-1].payload, OptionResultPayload)
+        assert result[-1].payload.invocation_id == "pending"
+
+    @pytest.mark.asyncio
+    async def test_payload_subclasses_are_matched(self):
+        """Test that option_call/option_result payload subclasses are still handled."""
+        from pocket_joe import policy, InMemoryRunner
+
+        class TracedCall(OptionCallPayload):
+            pass
+
+        class TracedResult(OptionResultPayload):
+            pass
+
+        calls = []
+
+        @policy.tool(description="Counted tool")
+        async def counted(value: int) -> int:
+            calls.append(value)
+            return value
+
+        @policy.tool(description="Orchestrator")
+        async def orchestrator() -> list[Message]:
+            return [
+                Message(policy="orchestrator", payload=TracedCall(
+                    invocation_id="done", option_name="counted", arguments={"value": 1})),
+                Message(policy="counted", payload=TracedResult(
+                    invocation_id="done", option_name="counted", result=1)),
+                Message(policy="orchestrator", payload=TracedCall(
+                    invocation_id="pending", option_name="counted", arguments={"value": 2})),
+            ]
+
+        ctx = BaseContext(InMemoryRunner())
+        ctx._bind(counted)
+        bound = ctx._bind(orchestrator)
+
+        result = await bound()
+
+        assert calls == [2]
+        assert len(result) == 4
+        assert result[-1].payload.invocation_id == "pending"
+
+    @pytest.mark.asyncio
+    async def test_context_active_only_during_call(self):
+        """Test that get_ctx() works inside a bound policy but does not leak out."""
+        from pocket_joe import policy, InMemoryRunner
+
+        class ScopedContext(BaseContext):
+            pass
+
+        @policy.tool(description="Return the active context")
+        async def current_ctx() -> BaseContext:
+            return ScopedContext.get_ctx()
+
+        ctx = ScopedContext(InMemoryRunner())
+        bound = ctx._bind(current_ctx)
+
+        # Construction alone does not set the context
+        with pytest.raises(RuntimeError, match="No active ScopedContext"):
+            ScopedContext.get_ctx()
+
+        assert await bound() is ctx
+
+        with pytest.raises(RuntimeError, match="No active ScopedContext"):
+            ScopedContext.get_ctx()
+
+    def test_context_manager_activates(self):
+        """Test that using the context as a context manager activates it."""
+        from pocket_joe import InMemoryRunner
+
+        class ManagedContext(BaseContext):
+            pass
+
+        ctx = ManagedContext(InMemoryRunner())
+        with ctx as active:
+            assert active is ctx
+            assert ManagedContext.get_ctx() is ctx
+
+        with pytest.raises(RuntimeError, match="No active ManagedContext"):
+            ManagedContext.get_ctx()
+
+    def test_nested_context_manager_restores(self):
+        """Test that nested activations of one context unwind fully."""
+        from pocket_joe import InMemoryRunner
+
+        class NestedContext(BaseContext):
+            pass
+
+        ctx = NestedContext(InMemoryRunner())
+        with ctx:
+            with ctx:
+                assert NestedContext.get_ctx() is ctx
+            assert NestedContext.get_ctx() is ctx
+
+        with pytest.raises(RuntimeError, match="No active NestedContext"):
+            NestedContext.get_ctx()
+
+    def test_activate_returns_token_for_deactivate(self):
+        """Test that activate()/deactivate(token) scope the context explicitly."""
+        from pocket_joe import InMemoryRunner
+
+        class ManualContext(BaseContext):
+            pass
+
+        ctx = ManualContext(InMemoryRunner())
+        token = ctx.activate()
+        assert ManualContext.get_ctx() is ctx
+        ctx.deactivate(token)
+
+        with pytest.raises(RuntimeError, match="No active ManualContext"):
+            ManualContext.get_ctx()
+
+    def test_out_of_order_deactivate_rejected(self):
+        """Test that deactivating out of LIFO order raises instead of restoring a stale context."""
+        from pocket_joe import InMemoryRunner
+
+        class OrderedContext(BaseContext):
+            pass
+
+        a = OrderedContext(InMemoryRunner())
+        b = OrderedContext(InMemoryRunner())
+        a_token = a.activate()
+        b_token = b.activate()
+
+        with pytest.raises(RuntimeError, match="reverse order"):
+            a.deactivate(a_token)
+
+        b.deactivate(b_token)
+        a.deactivate(a_token)
+        with pytest.raises(RuntimeError, match="No active OrderedContext"):
+            OrderedContext.get_ctx()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_tasks_share_context(self):
+        """Test that tasks activating the same context don't disturb each other."""
+        import asyncio
+        from pocket_joe import InMemoryRunner
+
+        class SharedContext(BaseContext):
+            pass
+
+        ctx = SharedContext(InMemoryRunner())
+        entered = asyncio.Event()
+
+        async def first():
+            with ctx:
+                entered.set()
+                await asyncio.sleep(0.01)
+                assert SharedContext.get_ctx() is ctx
+            with pytest.raises(RuntimeError):
+                SharedContext.get_ctx()
+
+        async def second():
+            await entered.wait()
+            with ctx:
+                assert SharedContext.get_ctx() is ctx
+            with pytest.raises(RuntimeError):
+                SharedContext.get_ctx()
+
+        await asyncio.gather(first(), second())
+
+        with pytest.raises(RuntimeError, match="No active SharedContext"):
+            SharedContext.get_ctx()
+
+    @pytest.mark.asyncio
+    async def test_unknown_option_fails_before_running_siblings(self):
+        """Test that an unknown option name fails before any option runs."""
+        from pocket_joe import policy, InMemoryRunner
+
+        calls = []
+
+        @policy.tool(description="Known tool")
+        async def known() -> str:
+            calls.append("known")
+            return "ok"
+
+        @policy.tool(description="Orchestrator")
+        async def orchestrator() -> list[Message]:
+            first = MessageBuilder(policy="orchestrator")
+            first.add_option_call("known", {})
+            second = MessageBuilder(policy="orchestrator")
+            second.add_option_call("missing", {})
+            return first.to_messages() + second.to_messages()
+
+        ctx = BaseContext(InMemoryRunner())
+        ctx._bind(known)
+        bound = ctx._bind(orchestrator)
+
+        with pytest.raises(ValueError, match="Bound policy not found for option 'missing'"):
+            await bound()
+        assert calls == []
+
+    @pytest.mark.asyncio
+    async def test_failing_option_cancels_siblings(self):
+        """Test that a failing option cancels options still running."""
+        import asyncio
+        from pocket_joe import policy, InMemoryRunner
+
+        cancelled = []
+
+        @policy.tool(description="Slow tool")
+        async def slow() -> str:
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append("slow")
+                raise
+            return "done"
+
+        @policy.tool(description="Failing tool")
+        async def failing() -> str:
+            raise RuntimeError("boom")
+
+        @policy.tool(description="Orchestrator")
+        async def orchestrator() -> list[Message]:
+            first = MessageBuilder(policy="orchestrator")
+            first.add_option_call("slow", {})
+            second = MessageBuilder(policy="orchestrator")
+            second.add_option_call("failing", {})
+            return first.to_messages() + second.to_messages()
+
+        ctx = BaseContext(InMemoryRunner())
+        ctx._bind(slow)
+        ctx._bind(failing)
+        bound = ctx._bind(orchestrator)
+
+        with pytest.raises(RuntimeError, match="boom"):
+            await asyncio.wait_for(bound(), timeout=5)
+        assert cancelled == ["slow"]
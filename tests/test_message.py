@@ -8,6 +8,9 @@ from pocket_joe import (
     MessageBuilder,
     MediaPart,
     TextPart,
+    OptionCallPayload,
+    OptionResultPayload,
+    OptionResultBuilder,
     iter_parts,
 )
 
@@ -260,3 +263,101 @@ class TestIterParts:
 
         has_image2 = any(p.data_b64 for p in iter_parts(messages2, MediaPart))
         assert has_image2 is False
+
+
+class TestOptionResultBuilder:
+    """Test OptionResultBuilder success/error messages."""
+
+    def _option_call(self) -> Message:
+        return Message(
+            policy="assistant",
+            step_num=3,
+            payload=OptionCallPayload(
+                invocation_id="inv_1",
+                option_name="get_weather",
+                arguments={"city": "SF"},
+            ),
+        )
+
+    def test_success(self):
+        """Test success copies call metadata and stores the result."""
+        msg = OptionResultBuilder.response_to(self._option_call()).success({"temp": 20})
+
+        assert msg.policy == "get_weather"
+        assert msg.step_num == 3
+        assert msg.role_hint_for_llm == "tool"
+        assert msg.id
+        assert isinstance(msg.payload, OptionResultPayload)
+        assert msg.payload.kind == "option_result"
+        assert msg.payload.invocation_id == "inv_1"
+        assert msg.payload.option_name == "get_weather"
+        assert msg.payload.result == {"temp": 20}
+        assert msg.payload.is_error is False
+        assert msg.payload.error_type is None
+
+    def test_success_message_is_frozen(self):
+        """Test success messages stay immutable."""
+        msg = OptionResultBuilder(self._option_call()).success("ok")
+
+        with pytest.raises(Exception):
+            msg.policy = "other"  # type: ignore
+
+    def test_error(self):
+        """Test error populates structured error fields."""
+        msg = OptionResultBuilder(self._option_call()).error(
+            error_type="Timeout",
+            error_message="took too long",
+            retryable=True,
+        )
+
+        assert isinstance(msg.payload, OptionResultPayload)
+        assert msg.payload.is_error is True
+        assert msg.payload.result is None
+        assert msg.payload.error_type == "Timeout"
+        assert msg.payload.retryable is True
+
+    def test_requires_option_call(self):
+        """Test builder rejects messages without an option_call payload."""
+        builder = MessageBuilder(policy="user")
+        builder.add_text("hi")
+
+        with pytest.raises(ValueError, match="must be an option_call"):
+            OptionResultBuilder(builder.to_message())
+
+
+class TestMessageIds:
+    """Test framework-generated message and invocation IDs."""
+
+    def test_ids_are_unique(self):
+        """Test builders assign a distinct id to every message and invocation."""
+        ids = set()
+        for _ in range(100):
+            builder = MessageBuilder(policy="test")
+            builder.add_text("hi")
+            builder.add_option_call("tool", {})
+            call = builder.last_option_call
+            assert call is not None and isinstance(call.payload, OptionCallPayload)
+            ids.update([builder.to_message().id, call.id, call.payload.invocation_id])
+
+        assert len(ids) == 300
+        assert "" not in ids
+
+    def test_explicit_invocation_id_kept(self):
+        """Test an explicit invocation_id is used as given."""
+        builder = MessageBuilder(policy="test")
+        builder.add_option_call("tool", {}, invocation_id="call_1")
+
+        call = builder.last_option_call
+        assert call is not None and isinstance(call.payload, OptionCallPayload)
+        assert call.payload.invocation_id == "call_1"
+
+    def test_reset_id_source_changes_prefix(self):
+        """Test resetting the ID source (as a forked child does) starts a new prefix."""
+        from pocket_joe import message
+
+        before = message._new_id()
+        message._reset_id_source()
+        after = message._new_id()
+
+        assert before.rsplit("-", 1)[0] != after.rsplit("-", 1)[0]
+        assert after.endswith("-0")